@@ -0,0 +1,41 @@
+"""
+msgspec-backed JSON renderer for the API.
+
+Response payloads are dominated by large integer lists (sequences and
+seek operations); msgspec encodes them in C, several times faster than
+the stdlib json encoder DRF uses by default. Falls back to the standard
+JSONRenderer when msgspec is not installed.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; stdlib JSON fallback below
+    msgspec = None
+
+
+if msgspec is not None:
+    def _enc_hook(obj):
+        # DRF error payloads carry ErrorDetail, a str subclass msgspec
+        # refuses to encode; serialize anything string-like as its text.
+        if isinstance(obj, str):
+            return str(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    _encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+    class MsgspecJSONRenderer(JSONRenderer):
+        """JSONRenderer that delegates encoding to msgspec."""
+
+        def render(self, data, accepted_media_type=None, renderer_context=None):
+            if data is None:
+                return b""
+            try:
+                return _encoder.encode(data)
+            except TypeError:
+                # Types neither msgspec nor the hook cover; let DRF's
+                # stdlib encoder handle them rather than erroring a response.
+                return super().render(data, accepted_media_type, renderer_context)
+else:
+    MsgspecJSONRenderer = JSONRenderer
@@ -2,32 +2,34 @@
 Django REST Framework views for Disk Scheduling Algorithm Simulator API
 """
 
+import numpy as np
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from app.algorithms.disk_scheduling import DiskScheduler
-from typing import List
+from app.algorithms.disk_scheduling import DiskScheduler, simulate_cached
 
 
-def _calculate_fairness_index(seek_operations: List[tuple]) -> float:
+def _seek_distances(result: dict) -> np.ndarray:
+    """Per-seek distances from the parallel seek_from/seek_to columns."""
+    seek_from = np.asarray(result["seek_from"], dtype=np.int64)
+    seek_to = np.asarray(result["seek_to"], dtype=np.int64)
+    return np.abs(seek_to - seek_from)
+
+
+def _calculate_fairness_index(seek_distances: np.ndarray) -> float:
     """Calculate fairness index based on variance of seek distances"""
-    if not seek_operations:
-        return 0.0
-    
-    seek_distances = [abs(to - from_pos) for from_pos, to in seek_operations]
-    if not seek_distances:
+    if not seek_distances.size:
         return 0.0
-    
-    mean = sum(seek_distances) / len(seek_distances)
+
+    mean = float(seek_distances.mean())
     if mean == 0:
         return 1.0
-    
-    variance = sum((d - mean) ** 2 for d in seek_distances) / len(seek_distances)
-    std_dev = variance ** 0.5
-    
+
+    std_dev = float(seek_distances.std())
+
     # Fairness index: lower variance = higher fairness
     # Normalize to 0-1 scale
-    fairness = max(0, 1 - (std_dev / mean)) if mean > 0 else 1.0
+    fairness = max(0, 1 - (std_dev / mean))
     return round(fairness, 2)
 
 
@@ -151,24 +153,23 @@ def simulate(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        scheduler = DiskScheduler(
+        # Memoized: repeated runs with the same inputs skip recomputation.
+        result = simulate_cached(
             requests=requests_list,
             initial_position=initial_position,
-            disk_size=disk_size
-        )
-
-        result = scheduler.simulate(
+            disk_size=disk_size,
             algorithm=algorithm,
             direction=direction,
             n_step=n_step
         )
         
         # Calculate additional performance metrics
+        seek_distances = _seek_distances(result)
         performance_metrics = {
             "efficiency": round((1 - result["total_seek_time"] / (disk_size * len(requests_list))) * 100, 2) if requests_list else 0,
             "throughput": round(len(requests_list) / result["total_seek_time"] * 100, 2) if result["total_seek_time"] > 0 else 0,
-            "fairness_index": _calculate_fairness_index(result["seek_operations"]),
-            "max_seek_distance": max([abs(to - from_pos) for from_pos, to in result["seek_operations"]], default=0)
+            "fairness_index": _calculate_fairness_index(seek_distances),
+            "max_seek_distance": int(seek_distances.max()) if seek_distances.size else 0
         }
         
         response_data = {
@@ -185,7 +186,9 @@ def simulate(request):
                 "sequence": result["sequence"],
                 "total_seek_time": result["total_seek_time"],
                 "average_seek_time": result["average_seek_time"],
-                "seek_operations": result["seek_operations"]
+                "seek_operations": result["seek_operations"],
+                "seek_from": result["seek_from"],
+                "seek_to": result["seek_to"]
             },
             "performance_metrics": performance_metrics
         }
@@ -251,13 +254,20 @@ def compare_algorithms(request):
             n_step = 4
         results = []
 
+        # The six core algorithms share one sorted array and one vectorized
+        # seek-time reduction; only the batched variants run individually.
+        batch_results = scheduler.simulate_all(direction=direction)
+
         for algo in algorithms:
             try:
-                result = scheduler.simulate(
-                    algorithm=algo,
-                    direction=direction,
-                    n_step=n_step if algo == "N-STEP SCAN" else None
-                )
+                if algo in batch_results:
+                    result = batch_results[algo]
+                else:
+                    result = scheduler.simulate(
+                        algorithm=algo,
+                        direction=direction,
+                        n_step=n_step if algo == "N-STEP SCAN" else None
+                    )
                 results.append(result)
             except Exception as e:
                 results.append({
@@ -0,0 +1,90 @@
+/*
+ * Optional C implementation of the SSTF inner loop.
+ *
+ * Exposes sstf_sequence(arr, start, out): arr and out are contiguous int32
+ * buffers of equal length; the serviced sequence is written into out.
+ * Built via backend/setup.py (build_ext --inplace); the Python side falls
+ * back to the Numba/NumPy paths when the module is not available.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+static PyObject *
+sstf_sequence(PyObject *self, PyObject *args)
+{
+    Py_buffer in, out;
+    int start;
+
+    if (!PyArg_ParseTuple(args, "y*iw*", &in, &start, &out))
+        return NULL;
+
+    if (in.len != out.len || in.len % (Py_ssize_t)sizeof(int32_t) != 0) {
+        PyBuffer_Release(&in);
+        PyBuffer_Release(&out);
+        PyErr_SetString(PyExc_ValueError,
+                        "arr and out must be int32 buffers of equal length");
+        return NULL;
+    }
+
+    const Py_ssize_t n = in.len / (Py_ssize_t)sizeof(int32_t);
+    const int32_t *arr = (const int32_t *)in.buf;
+    int32_t *dst = (int32_t *)out.buf;
+
+    uint8_t *alive = (uint8_t *)malloc((size_t)(n > 0 ? n : 1));
+    if (alive == NULL) {
+        PyBuffer_Release(&in);
+        PyBuffer_Release(&out);
+        return PyErr_NoMemory();
+    }
+    memset(alive, 1, (size_t)n);
+
+    int32_t cur = (int32_t)start;
+    for (Py_ssize_t k = 0; k < n; k++) {
+        int64_t best_d = INT64_MAX;
+        Py_ssize_t best_j = -1;
+        for (Py_ssize_t j = 0; j < n; j++) {
+            if (alive[j]) {
+                int64_t d = (int64_t)arr[j] - (int64_t)cur;
+                if (d < 0)
+                    d = -d;
+                if (d < best_d) {
+                    best_d = d;
+                    best_j = j;
+                }
+            }
+        }
+        alive[best_j] = 0;
+        cur = arr[best_j];
+        dst[k] = cur;
+    }
+
+    free(alive);
+    PyBuffer_Release(&in);
+    PyBuffer_Release(&out);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef sstf_methods[] = {
+    {"sstf_sequence", sstf_sequence, METH_VARARGS,
+     "sstf_sequence(arr, start, out): write the SSTF service order into out."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef sstf_module = {
+    PyModuleDef_HEAD_INIT,
+    "_sstf_c",
+    "C implementation of the SSTF nearest-neighbour loop.",
+    -1,
+    sstf_methods
+};
+
+PyMODINIT_FUNC
+PyInit__sstf_c(void)
+{
+    return PyModule_Create(&sstf_module);
+}
@@ -3,207 +3,436 @@ Disk Scheduling Algorithms Implementation
 Implements various disk scheduling algorithms for efficient disk I/O operations.
 """
 
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import List, Tuple, Optional
-from copy import deepcopy
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+
+try:
+    from . import _sstf_c
+except ImportError:  # optional C extension; built via backend/setup.py
+    _sstf_c = None
+
+try:
+    import diskcache
+    import msgspec
+except ImportError:  # both optional; the in-process LRU still applies
+    diskcache = None
+
+# Persistent result cache shared across processes and restarts. Entries are
+# msgspec-encoded bytes; the size cap bounds disk usage. The default path is
+# keyed by UID so users on a shared host get separate caches and cannot seed
+# each other's entries; DISKSCHED_CACHE_DIR overrides it. Construction
+# failures (unwritable directory, corrupt sqlite file) degrade to the
+# in-process LRU rather than breaking the module import.
+_DISK_CACHE = None
+if diskcache is not None:
+    _cache_dir = os.environ.get("DISKSCHED_CACHE_DIR")
+    if _cache_dir is None:
+        # POSIX /tmp is shared between users; Windows %TEMP% is already
+        # per-user, so it needs no suffix.
+        _suffix = f"_{os.getuid()}" if hasattr(os, "getuid") else ""
+        _cache_dir = os.path.join(tempfile.gettempdir(), "disksched_cache" + _suffix)
+    try:
+        _DISK_CACHE = diskcache.Cache(_cache_dir, size_limit=64 * 1024 * 1024)
+    except Exception:
+        _DISK_CACHE = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=False)
+    def _sstf_nb(arr, start):
+        """Compiled SSTF inner loop: nearest-neighbour scan over an int32 array."""
+        n = arr.shape[0]
+        out = np.empty_like(arr)
+        alive = np.ones(n, np.bool_)
+        current = start
+        for k in range(n):
+            best_d = np.int64(2 ** 62)
+            best_j = -1
+            for j in range(n):
+                if alive[j]:
+                    d = np.int64(arr[j]) - np.int64(current)
+                    if d < 0:
+                        d = -d
+                    if d < best_d:
+                        best_d = d
+                        best_j = j
+            alive[best_j] = False
+            current = arr[best_j]
+            out[k] = current
+        return out
+
+    @njit(cache=True, fastmath=False)
+    def _directional_nb(keyed, key_start, circular, to_edge, near_edge, far_edge):
+        """
+        Fused directional kernel: emits the sequence and accumulates the seek
+        total in the same pass, in the sign-multiplied key space used by
+        DiskScheduler._directional_sequence.
+        """
+        n = keyed.shape[0]
+        split = np.searchsorted(keyed, key_start)
+        extra = 0
+        if split > 0 and to_edge:
+            extra = 2 if circular else 1
+        out = np.empty(n + extra, np.int32)
+        total = np.int64(0)
+        cur = np.int64(key_start)
+        k = 0
+        # Leg ahead of the head, in travel order.
+        for i in range(split, n):
+            v = np.int64(keyed[i])
+            d = v - cur
+            total += d if d >= 0 else -d
+            out[k] = keyed[i]
+            cur = v
+            k += 1
+        if split > 0:
+            if to_edge:
+                d = np.int64(near_edge) - cur
+                total += d if d >= 0 else -d
+                out[k] = near_edge
+                cur = np.int64(near_edge)
+                k += 1
+                if circular:
+                    d = np.int64(far_edge) - cur
+                    total += d if d >= 0 else -d
+                    out[k] = far_edge
+                    cur = np.int64(far_edge)
+                    k += 1
+            if circular:
+                # Wrap-around: the far leg restarts in travel order.
+                for i in range(split):
+                    v = np.int64(keyed[i])
+                    d = v - cur
+                    total += d if d >= 0 else -d
+                    out[k] = keyed[i]
+                    cur = v
+                    k += 1
+            else:
+                # Reversal: the far leg is serviced nearest-first.
+                for i in range(split - 1, -1, -1):
+                    v = np.int64(keyed[i])
+                    d = v - cur
+                    total += d if d >= 0 else -d
+                    out[k] = keyed[i]
+                    cur = v
+                    k += 1
+        return out, total
+
+    # Compile once at import so the first API call does not pay JIT latency.
+    _sstf_nb(np.zeros(1, dtype=np.int32), 0)
+    _directional_nb(np.zeros(1, dtype=np.int32), 0, False, False, 0, 0)
+else:
+    _sstf_nb = None
+    _directional_nb = None
+
+
+@dataclass
+class SimResult:
+    """
+    Result of a single scheduling run.
+
+    seek_operations is derived from (initial_position, sequence) the first
+    time it is read, so callers that only consume the sequence and totals
+    never pay for materializing the (from, to) pairs.
+    """
+    sequence: List[int]
+    total_seek_time: int
+    initial_position: int
+
+    @cached_property
+    def seek_from(self) -> np.ndarray:
+        """Start track of every seek, as an int32 array (structure-of-arrays layout)."""
+        n = len(self.sequence)
+        positions = np.empty(n, dtype=np.int32)
+        if n:
+            positions[0] = self.initial_position
+            positions[1:] = self.sequence[:-1]
+        return positions
+
+    @cached_property
+    def seek_to(self) -> np.ndarray:
+        """Destination track of every seek, as an int32 array."""
+        return np.asarray(self.sequence, dtype=np.int32)
+
+    @cached_property
+    def seek_operations(self) -> List[Tuple[int, int]]:
+        """(from, to) pairs; only materialized for the JSON boundary."""
+        return list(zip(self.seek_from.tolist(), self.seek_to.tolist()))
 
 
 class DiskScheduler:
-    """Main class for disk scheduling algorithms"""
-    
-    def __init__(self, requests: List[int], initial_position: int, disk_size: int = 200):
+    """
+    Main class for disk scheduling algorithms
+
+    Instances are treated as immutable after construction, which makes the
+    cached derived views (e.g. the sorted request array) safe to share
+    across repeated simulate() calls.
+    """
+
+    def __init__(self, requests: List[int], initial_position: int, disk_size: int = 200,
+                 collapse_duplicates: bool = True):
         """
         Initialize the disk scheduler
-        
+
+        Track numbers are held as int32 end-to-end (requests, sorted views,
+        sequences, seek columns), so disk_size is capped at 2**31.
+
         Args:
             requests: List of track requests
             initial_position: Initial head position
-            disk_size: Total number of tracks on the disk
+            disk_size: Total number of tracks on the disk (at most 2**31)
+            collapse_duplicates: Service repeated tracks as a single stop in
+                the directional algorithms; they add no seek distance, so
+                this only shortens the reported sequence. FCFS and SSTF
+                always report every request.
         """
-        self.requests = deepcopy(requests)
+        if disk_size > 2 ** 31:
+            raise ValueError(f"disk_size must be at most 2**31, got {disk_size}")
+        if not -2 ** 31 <= initial_position < 2 ** 31:
+            raise ValueError(
+                f"initial_position {initial_position} does not fit in a 32-bit track number")
+        arr = np.asarray(requests)
+        if arr.dtype.kind == "f":
+            # JSON happily delivers floats; casting them to int32 would
+            # silently drop the fractional part, so reject them instead.
+            fractional = arr != np.floor(arr)
+            if fractional.any():
+                offender = arr[int(np.argmax(fractional))]
+                raise ValueError(f"Request {offender} is not an integer track number")
+        # Bounds-check at the incoming width, then narrow: values past the
+        # int32 range would otherwise raise OverflowError in the cast before
+        # validate_requests() could report them as out of bounds.
+        self._arr: np.ndarray = arr
         self.initial_position = initial_position
         self.disk_size = disk_size
+        self.collapse_duplicates = collapse_duplicates
         self.validate_requests()
+        self._arr = self._arr.astype(np.int32)
+
+    @property
+    def requests(self) -> List[int]:
+        """The request list in arrival order (materialized from the int32 array)."""
+        return self._arr.tolist()
+
+    @cached_property
+    def _sorted(self) -> np.ndarray:
+        """
+        Requests sorted ascending; computed once and shared by all directional
+        algorithms. With collapse_duplicates this is the distinct tracks only,
+        dropping n to the number of unique positions.
+        """
+        if self.collapse_duplicates:
+            return np.unique(self._arr)
+        return np.sort(self._arr)
+
+    @cached_property
+    def _argsort(self) -> np.ndarray:
+        """Stable argsort of the request array; cached so index-aware views never re-sort."""
+        return np.argsort(self._arr, kind="stable")
+
+    def tagged_sequence(self) -> Tuple[List[int], List[int]]:
+        """
+        Sorted tracks paired with the arrival-order index of each request.
+
+        Returns:
+            Tuple of (sorted_tracks, original_indices); duplicates keep
+            their arrival order thanks to the stable sort.
+        """
+        order = self._argsort
+        return self._arr[order].tolist(), order.tolist()
     
     def validate_requests(self):
-        """Validate that all requests are within disk bounds"""
-        for req in self.requests:
-            if req < 0 or req >= self.disk_size:
-                raise ValueError(f"Request {req} is out of bounds (0-{self.disk_size-1})")
+        """Validate that all requests are within disk bounds (one vectorized pass)"""
+        bad = (self._arr < 0) | (self._arr >= self.disk_size)
+        if bad.any():
+            offender = self._arr[int(np.argmax(bad))]
+            raise ValueError(f"Request {offender} is out of bounds (0-{self.disk_size-1})")
     
+    def _total_seek_time(self, sequence: List[int]) -> int:
+        """
+        Total seek distance for a sequence, as one diff/abs/sum reduction.
+
+        The buffer is int64: tracks fit int32, but adjacent differences can
+        approach 2**32 at the admitted extremes, and the compiled kernels
+        already accumulate in int64.
+        """
+        n = len(sequence)
+        if not n:
+            return 0
+        prefixed = np.empty(n + 1, dtype=np.int64)
+        prefixed[0] = self.initial_position
+        prefixed[1:] = sequence
+        return int(np.abs(np.diff(prefixed)).sum())
+
     def calculate_seek_time(self, sequence: List[int]) -> Tuple[int, List[Tuple[int, int]]]:
         """
         Calculate total seek time and individual seek operations
-        
+
+        Kept for compatibility; the algorithms themselves return a SimResult
+        whose seek_operations materialize on demand.
+
         Args:
             sequence: Sequence of track accesses
-            
+
         Returns:
             Tuple of (total_seek_time, list of (from, to) operations)
         """
-        if not sequence:
-            return 0, []
-        
-        seek_operations = []
-        total_seek_time = 0
-        current = self.initial_position
-        
-        for track in sequence:
-            seek_distance = abs(track - current)
-            seek_operations.append((current, track))
-            total_seek_time += seek_distance
-            current = track
-        
-        return total_seek_time, seek_operations
+        result = SimResult(list(sequence), self._total_seek_time(sequence), self.initial_position)
+        return result.total_seek_time, result.seek_operations
     
-    def fcfs(self) -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def _fcfs_sequence(self) -> List[int]:
+        return self._arr.tolist()
+
+    def fcfs(self) -> SimResult:
         """
         First Come First Served (FCFS) Algorithm
         Services requests in the order they arrive.
         
         Returns:
-            Tuple of (sequence, total_seek_time, seek_operations)
+            SimResult with the arrival-order sequence
         """
-        sequence = self.requests.copy()
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
+        sequence = self._fcfs_sequence()
+        return SimResult(sequence, self._total_seek_time(sequence), self.initial_position)
     
-    def sstf(self) -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def _sstf_sequence(self) -> List[int]:
+        # Fastest available implementation: C extension, then Numba, then NumPy.
+        if _sstf_c is not None:
+            out = np.empty_like(self._arr)
+            _sstf_c.sstf_sequence(self._arr, int(self.initial_position), out)
+            sequence = out.tolist()
+        elif _sstf_nb is not None:
+            sequence = _sstf_nb(self._arr, self.initial_position).tolist()
+        else:
+            sequence = []
+            current_position = self.initial_position
+            n = self._arr.shape[0]
+            alive = np.ones(n, dtype=bool)
+
+            # Each step computes all distances in one vectorized pass and picks
+            # the argmin, instead of a Python-level min() scan over a shrinking list.
+            for _ in range(n):
+                distances = np.abs(self._arr - current_position)
+                distances[~alive] = np.iinfo(np.int32).max
+                closest_index = int(distances.argmin())
+                alive[closest_index] = False
+                current_position = int(self._arr[closest_index])
+                sequence.append(current_position)
+
+        return sequence
+
+    def sstf(self) -> SimResult:
         """
         Shortest Seek Time First (SSTF) Algorithm
         Always services the request closest to the current head position.
-        
+
         Returns:
-            Tuple of (sequence, total_seek_time, seek_operations)
+            SimResult with the nearest-first sequence
         """
-        sequence = []
-        remaining_requests = self.requests.copy()
-        current_position = self.initial_position
-        
-        while remaining_requests:
-            # Find the closest request
-            closest = min(remaining_requests, key=lambda x: abs(x - current_position))
-            sequence.append(closest)
-            remaining_requests.remove(closest)
-            current_position = closest
-        
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
-    
-    def scan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+        sequence = self._sstf_sequence()
+        return SimResult(sequence, self._total_seek_time(sequence), self.initial_position)
+
+    def _directional_sequence(self, mode: int, circular: bool, to_edge: bool) -> List[int]:
+        """
+        Shared implementation of the four directional algorithms.
+
+        mode is +1 (toward higher tracks) or -1; multiplying tracks by mode
+        maps both directions onto one ascending problem, so there is a
+        single code path instead of mirrored going_right branches.
+        circular selects the C-SCAN/C-LOOK wrap-around (the far leg is
+        serviced in travel order rather than nearest-first); to_edge adds
+        the disk-edge sentinels used by SCAN and C-SCAN.
+        """
+        keyed = mode * self._sorted[::mode]
+        n = keyed.shape[0]
+        split = int(np.searchsorted(keyed, mode * self.initial_position, side="left"))
+        extra = (2 if circular else 1) if (split and to_edge) else 0
+
+        # The final length is known up front, so write slices into one
+        # preallocated buffer instead of growing a list or concatenating.
+        out = np.empty(n + extra, dtype=np.int32)
+        ahead_n = n - split
+        out[:ahead_n] = keyed[split:]
+        if split:
+            if to_edge:
+                near_edge = self.disk_size - 1 if mode > 0 else 0
+                out[ahead_n] = mode * near_edge
+                if circular:
+                    far_edge = 0 if mode > 0 else self.disk_size - 1
+                    out[ahead_n + 1] = mode * far_edge
+            out[ahead_n + extra:] = keyed[:split] if circular else keyed[:split][::-1]
+
+        if mode < 0:
+            np.negative(out, out)
+        return out.tolist()
+
+    def _directional_result(self, direction: str, circular: bool, to_edge: bool) -> SimResult:
+        """SimResult for a directional run, via the fused Numba kernel when available."""
+        mode = 1 if direction.lower() == "right" else -1
+        if _directional_nb is not None:
+            keyed = mode * self._sorted[::mode]
+            near_edge = mode * (self.disk_size - 1 if mode > 0 else 0)
+            far_edge = mode * (0 if mode > 0 else self.disk_size - 1)
+            out, total = _directional_nb(keyed, mode * self.initial_position,
+                                         circular, to_edge, near_edge, far_edge)
+            return SimResult((mode * out).tolist(), int(total), self.initial_position)
+        sequence = self._directional_sequence(mode, circular, to_edge)
+        return SimResult(sequence, self._total_seek_time(sequence), self.initial_position)
+
+    def _scan_sequence(self, direction: str) -> List[int]:
+        mode = 1 if direction.lower() == "right" else -1
+        return self._directional_sequence(mode, circular=False, to_edge=True)
+
+    def scan(self, direction: str = "right") -> SimResult:
         """
         SCAN Algorithm (Elevator Algorithm)
         Moves the head in one direction until the end, then reverses.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
-        
-        if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.append(self.disk_size - 1)
-                sequence.extend(sorted(left_side, reverse=True))
-        else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.append(0)
-                sequence.extend(sorted(right_side))
-        
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
-    
-    def c_scan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+        return self._directional_result(direction, circular=False, to_edge=True)
+
+    def _c_scan_sequence(self, direction: str) -> List[int]:
+        mode = 1 if direction.lower() == "right" else -1
+        return self._directional_sequence(mode, circular=True, to_edge=True)
+
+    def c_scan(self, direction: str = "right") -> SimResult:
         """
         C-SCAN Algorithm (Circular SCAN)
         Moves the head in one direction until the end, then jumps to the beginning.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
-        
-        if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.append(self.disk_size - 1)
-                sequence.append(0)
-                sequence.extend(sorted(left_side))
-        else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.append(0)
-                sequence.append(self.disk_size - 1)
-                sequence.extend(sorted(right_side, reverse=True))
-        
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
-    
-    def look(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+        return self._directional_result(direction, circular=True, to_edge=True)
+
+    def _look_sequence(self, direction: str) -> List[int]:
+        mode = 1 if direction.lower() == "right" else -1
+        return self._directional_sequence(mode, circular=False, to_edge=False)
+
+    def look(self, direction: str = "right") -> SimResult:
         """
         LOOK Algorithm - like SCAN but only to last request in direction.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
-        
-        if not remaining_requests:
-            return sequence, 0, []
-        
-        if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.extend(sorted(left_side, reverse=True))
-        else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.extend(sorted(right_side))
-        
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
-    
-    def c_look(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+        return self._directional_result(direction, circular=False, to_edge=False)
+
+    def _c_look_sequence(self, direction: str) -> List[int]:
+        mode = 1 if direction.lower() == "right" else -1
+        return self._directional_sequence(mode, circular=True, to_edge=False)
+
+    def c_look(self, direction: str = "right") -> SimResult:
         """
         C-LOOK Algorithm - like C-SCAN but only to last request.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
-        
-        if not remaining_requests:
-            return sequence, 0, []
-        
-        if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.extend(sorted(left_side))
-        else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.extend(sorted(right_side, reverse=True))
-        
-        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
-        return sequence, total_seek_time, seek_operations
+        return self._directional_result(direction, circular=True, to_edge=False)
 
-    def n_step_scan(self, n: int, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def n_step_scan(self, n: int, direction: str = "right") -> SimResult:
         """
         N-Step SCAN Algorithm.
         Splits requests into segments of size N and processes each segment with SCAN.
@@ -211,53 +440,123 @@ class DiskScheduler:
         """
         if n < 1:
             raise ValueError("N must be at least 1")
-        reqs = self.requests.copy()
+        reqs = self._arr.tolist()
         if not reqs:
-            return [], 0, []
+            return SimResult([], 0, self.initial_position)
         full_sequence = []
         current_position = self.initial_position
         going_right = direction.lower() == "right"
         total_seek_time = 0
-        all_seek_ops = []
         for i in range(0, len(reqs), n):
             batch = reqs[i : i + n]
-            scheduler = DiskScheduler(batch, current_position, self.disk_size)
-            seq, seek_time, seek_ops = scheduler.scan("right" if going_right else "left")
-            full_sequence.extend(seq)
-            total_seek_time += seek_time
-            all_seek_ops.extend(seek_ops)
-            if seq:
-                current_position = seq[-1]
+            scheduler = DiskScheduler(batch, current_position, self.disk_size,
+                                      collapse_duplicates=self.collapse_duplicates)
+            batch_result = scheduler.scan("right" if going_right else "left")
+            full_sequence.extend(batch_result.sequence)
+            total_seek_time += batch_result.total_seek_time
+            if batch_result.sequence:
+                current_position = batch_result.sequence[-1]
             going_right = not going_right  # alternate direction for next batch (common variant)
-        return full_sequence, total_seek_time, all_seek_ops
+        # Each batch starts where the previous one ended, so the combined
+        # seek trace is recoverable from (initial_position, full_sequence).
+        return SimResult(full_sequence, total_seek_time, self.initial_position)
 
-    def fscan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def fscan(self, direction: str = "right") -> SimResult:
         """
         FSCAN Algorithm.
         Uses two queues: while one queue is serviced with SCAN, new requests go to the other.
         For static input we split requests into two queues (first half / second half) and
         service queue 1 with SCAN, then queue 2 with SCAN from where we left off.
         """
-        reqs = self.requests.copy()
+        reqs = self._arr.tolist()
         if not reqs:
-            return [], 0, []
+            return SimResult([], 0, self.initial_position)
         mid = (len(reqs) + 1) // 2
         queue1, queue2 = reqs[:mid], reqs[mid:]
         full_sequence = []
         current_position = self.initial_position
         total_seek_time = 0
-        all_seek_ops = []
         for batch in (queue1, queue2):
             if not batch:
                 continue
-            scheduler = DiskScheduler(batch, current_position, self.disk_size)
-            seq, seek_time, seek_ops = scheduler.scan(direction)
-            full_sequence.extend(seq)
-            total_seek_time += seek_time
-            all_seek_ops.extend(seek_ops)
+            scheduler = DiskScheduler(batch, current_position, self.disk_size,
+                                      collapse_duplicates=self.collapse_duplicates)
+            batch_result = scheduler.scan(direction)
+            full_sequence.extend(batch_result.sequence)
+            total_seek_time += batch_result.total_seek_time
+            if batch_result.sequence:
+                current_position = batch_result.sequence[-1]
+        return SimResult(full_sequence, total_seek_time, self.initial_position)
+
+    #: Algorithms covered by simulate_all. The batched variants (N-Step SCAN,
+    #: FSCAN) take extra parameters and stay on the simulate() path.
+    CORE_ALGORITHMS = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+    #: O(1) dispatch table for simulate(): name -> (method, takes_direction).
+    #: N-Step SCAN is handled separately because it needs the batch size.
+    _DISPATCH = {
+        "FCFS": (fcfs, False),
+        "SSTF": (sstf, False),
+        "SCAN": (scan, True),
+        "C-SCAN": (c_scan, True),
+        "CSCAN": (c_scan, True),
+        "LOOK": (look, True),
+        "C-LOOK": (c_look, True),
+        "CLOOK": (c_look, True),
+        "FSCAN": (fscan, True),
+    }
+
+    def simulate_all(self, direction: str = "right") -> dict:
+        """
+        Run all core algorithms in one batch with shared preprocessing.
+
+        The sorted request array is computed once and shared, every sequence
+        is built up front, and all six seek totals come from a single
+        vectorized reduction over one stacked matrix instead of six separate
+        passes.
+
+        Args:
+            direction: Initial direction for the directional algorithms
+
+        Returns:
+            Dict mapping algorithm name to the same dict shape simulate() returns
+        """
+        sequences = {
+            "FCFS": self._fcfs_sequence(),
+            "SSTF": self._sstf_sequence(),
+            "SCAN": self._scan_sequence(direction),
+            "C-SCAN": self._c_scan_sequence(direction),
+            "LOOK": self._look_sequence(direction),
+            "C-LOOK": self._c_look_sequence(direction),
+        }
+
+        # Stack every sequence (head position prefixed, tail padded with the
+        # final position so padding contributes zero distance) and reduce
+        # once, in int64 so adjacent differences cannot wrap.
+        max_len = max(len(seq) for seq in sequences.values())
+        stacked = np.full((len(sequences), max_len + 1), self.initial_position, dtype=np.int64)
+        for row, seq in enumerate(sequences.values()):
+            stacked[row, 1:len(seq) + 1] = seq
             if seq:
-                current_position = seq[-1]
-        return full_sequence, total_seek_time, all_seek_ops
+                stacked[row, len(seq) + 1:] = seq[-1]
+        totals = np.abs(np.diff(stacked, axis=1)).sum(axis=1)
+
+        results = {}
+        for row, (name, seq) in enumerate(sequences.items()):
+            result = SimResult(seq, int(totals[row]), self.initial_position)
+            average_seek_time = result.total_seek_time / len(seq) if seq else 0
+            results[name] = {
+                "algorithm": name,
+                "sequence": result.sequence,
+                "total_seek_time": result.total_seek_time,
+                "average_seek_time": round(average_seek_time, 2),
+                "seek_operations": result.seek_operations,
+                "seek_from": result.seek_from.tolist(),
+                "seek_to": result.seek_to.tolist(),
+                "total_requests": int(self._arr.shape[0]),
+                "initial_position": self.initial_position
+            }
+        return results
 
     def simulate(self, algorithm: str, direction: str = "right", n_step: Optional[int] = None) -> dict:
         """
@@ -273,31 +572,22 @@ class DiskScheduler:
         """
         algorithm_upper = algorithm.upper().strip()
         # Normalize display name for N-Step SCAN
-        if algorithm_upper == "N-STEP SCAN" or algorithm_upper == "NSTEP SCAN":
+        if algorithm_upper == "NSTEP SCAN":
             algorithm_upper = "N-STEP SCAN"
-        if algorithm_upper == "FSCAN":
-            pass  # keep as FSCAN
-
-        if algorithm_upper == "FCFS":
-            sequence, total_seek_time, seek_operations = self.fcfs()
-        elif algorithm_upper == "SSTF":
-            sequence, total_seek_time, seek_operations = self.sstf()
-        elif algorithm_upper == "SCAN":
-            sequence, total_seek_time, seek_operations = self.scan(direction)
-        elif algorithm_upper in ("C-SCAN", "CSCAN"):
-            sequence, total_seek_time, seek_operations = self.c_scan(direction)
-        elif algorithm_upper == "LOOK":
-            sequence, total_seek_time, seek_operations = self.look(direction)
-        elif algorithm_upper in ("C-LOOK", "CLOOK"):
-            sequence, total_seek_time, seek_operations = self.c_look(direction)
-        elif algorithm_upper == "N-STEP SCAN":
+
+        if algorithm_upper == "N-STEP SCAN":
+            # Dispatched separately: the only algorithm with an extra parameter.
             n = n_step if n_step is not None and n_step >= 1 else 4
-            sequence, total_seek_time, seek_operations = self.n_step_scan(n, direction)
-        elif algorithm_upper == "FSCAN":
-            sequence, total_seek_time, seek_operations = self.fscan(direction)
+            result = self.n_step_scan(n, direction)
         else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
-        
+            entry = self._DISPATCH.get(algorithm_upper)
+            if entry is None:
+                raise ValueError(f"Unknown algorithm: {algorithm}")
+            method, takes_direction = entry
+            result = method(self, direction) if takes_direction else method(self)
+
+        sequence = result.sequence
+        total_seek_time = result.total_seek_time
         average_seek_time = total_seek_time / len(sequence) if sequence else 0
 
         return {
@@ -305,7 +595,52 @@ class DiskScheduler:
             "sequence": sequence,
             "total_seek_time": total_seek_time,
             "average_seek_time": round(average_seek_time, 2),
-            "seek_operations": seek_operations,
+            "seek_operations": result.seek_operations,
+            "seek_from": result.seek_from.tolist(),
+            "seek_to": result.seek_to.tolist(),
             "total_requests": len(self.requests),
             "initial_position": self.initial_position
         }
+
+
+def _disk_cache_key(requests_tuple: Tuple[int, ...], initial_position: int, disk_size: int,
+                    algorithm: str, direction: str, n_step: Optional[int]) -> bytes:
+    # Arrival order is part of the key: FCFS and the batched algorithms
+    # depend on it, so the request list is hashed as given, not sorted.
+    payload = json.dumps(
+        [list(requests_tuple), initial_position, disk_size, algorithm, direction, n_step]
+    ).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+@lru_cache(maxsize=1024)
+def _cached_simulate(requests_tuple: Tuple[int, ...], initial_position: int, disk_size: int,
+                     algorithm: str, direction: str, n_step: Optional[int]) -> dict:
+    if _DISK_CACHE is not None:
+        key = _disk_cache_key(requests_tuple, initial_position, disk_size,
+                              algorithm, direction, n_step)
+        cached = _DISK_CACHE.get(key)
+        if cached is not None:
+            return msgspec.json.decode(cached)
+
+    scheduler = DiskScheduler(list(requests_tuple), initial_position, disk_size)
+    result = scheduler.simulate(algorithm, direction, n_step)
+
+    if _DISK_CACHE is not None:
+        # msgspec-encoded bytes keep the store compact and avoid pickle.
+        _DISK_CACHE.set(key, msgspec.json.encode(result))
+    return result
+
+
+def simulate_cached(requests: List[int], initial_position: int, disk_size: int,
+                    algorithm: str, direction: str = "right", n_step: Optional[int] = None) -> dict:
+    """
+    Memoized front door for DiskScheduler.simulate().
+
+    Repeated calls with the same inputs (the typical re-render / direction
+    tweak workflow) return the cached result dict in O(1) instead of
+    re-running the algorithm. Cached dicts are shared between callers and
+    must not be mutated.
+    """
+    return _cached_simulate(tuple(requests), initial_position, disk_size,
+                            algorithm, direction, n_step)
@@ -1,27 +1,38 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+"""
+msgspec Structs describing the API request/response shapes.
 
+Structs validate and encode in C, avoiding per-element validation of the
+potentially thousands of (from, to) pairs in seek_operations.
+"""
 
-class SimulationRequest(BaseModel):
+from typing import List, Optional, Tuple
+
+import msgspec
+
+
+class SimulationRequest(msgspec.Struct):
     """Request model for disk scheduling simulation"""
-    requests: List[int] = Field(..., description="List of disk track requests")
-    initial_position: int = Field(..., ge=0, description="Initial head position")
-    algorithm: str = Field(..., description="Algorithm name: FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK")
-    disk_size: int = Field(default=200, ge=1, description="Total disk size (number of tracks)")
-    direction: Optional[str] = Field(default="right", description="Initial direction for SCAN/C-SCAN/LOOK/C-LOOK")
+    requests: List[int]
+    initial_position: int
+    algorithm: str
+    disk_size: int = 200
+    direction: Optional[str] = "right"
 
 
-class AlgorithmResult(BaseModel):
+class AlgorithmResult(msgspec.Struct):
     """Result for a single algorithm execution"""
     algorithm: str
-    sequence: List[int] = Field(..., description="Order of track accesses")
-    total_seek_time: int = Field(..., description="Total seek time (distance traveled)")
-    average_seek_time: float = Field(..., description="Average seek time")
-    seek_operations: List[tuple] = Field(..., description="List of (from, to) seek operations")
+    sequence: List[int]
+    total_seek_time: int
+    average_seek_time: float
+    seek_operations: List[Tuple[int, int]]
+    # Structure-of-arrays view of seek_operations: parallel from/to columns.
+    seek_from: List[int] = []
+    seek_to: List[int] = []
 
 
-class SimulationResponse(BaseModel):
+class SimulationResponse(msgspec.Struct):
     """Response model containing simulation results"""
     request: SimulationRequest
     result: AlgorithmResult
-    performance_metrics: dict = Field(..., description="Additional performance metrics")
+    performance_metrics: dict
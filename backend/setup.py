@@ -0,0 +1,28 @@
+"""
+Build script for the optional C extension used by the SSTF algorithm.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+The backend works without it; app.algorithms.disk_scheduling falls back
+to the Numba and NumPy implementations when the module is missing.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+
+extra_compile_args = [] if sys.platform == "win32" else ["-O3", "-march=native"]
+
+setup(
+    name="disk-scheduler-ext",
+    version="1.0.0",
+    ext_modules=[
+        Extension(
+            "app.algorithms._sstf_c",
+            sources=["app/algorithms/_sstf_c.c"],
+            extra_compile_args=extra_compile_args,
+        )
+    ],
+)